@@ -1,5 +1,6 @@
 
-import json, requests
+import asyncio, json
+from functools import lru_cache
 from pathlib import Path
 from time import sleep
 from urllib.parse import urljoin
@@ -9,14 +10,72 @@ from pathlib import Path
 from time import sleep
 from urllib.parse import urljoin
 
+import httpx
+import soupsieve as sv
 from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
-from transformers import pipeline            # HuggingFace summariser
+from transformers import AutoTokenizer, pipeline   # HuggingFace summariser
 
-BASE_URL = "https://www.capellaspace.com/media"
-OUTFILE  = Path("capella_media.jsonl")
-summarise = pipeline("summarization", model="facebook/bart-large-cnn",
-                     device_map="auto", max_length=60, min_length=25)
+BASE_URL  = "https://www.capellaspace.com/media"
+OUTFILE   = Path("capella_media.jsonl")
+SEL_GRAF  = sv.compile("article p")          # compiled once, used per article
+CARD_SEL  = ("a[href^='/'][href*='press-'], "
+             "a[href^='/'][href*='blog-'], "
+             "a[href^='/'][href*='in-the-news-']")
+MODEL_ID  = "facebook/bart-large-cnn"
+ONNX_DIR  = Path("bart-cnn-onnx")            # cached by actions/cache in CI
+INT8_DIR  = Path("bart-cnn-onnx-int8")
+
+
+@lru_cache(maxsize=1)
+def summarise_pipeline():
+    """
+    Lazily build the summariser on an ONNX Runtime INT8 model: ~400 MB on
+    disk instead of 1.6 GB FP32 and 2-3× faster on the CPU-only runner.
+    Export + quantization run once; later runs load the cached artifact.
+    """
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    if not INT8_DIR.exists():
+        model = ORTModelForSeq2SeqLM.from_pretrained(MODEL_ID, export=True)
+        model.save_pretrained(ONNX_DIR)
+        qconfig = AutoQuantizationConfig.avx2(is_static=False)
+        for onnx_file in ONNX_DIR.glob("*.onnx"):
+            quantizer = ORTQuantizer.from_pretrained(ONNX_DIR,
+                                                     file_name=onnx_file.name)
+            quantizer.quantize(save_dir=INT8_DIR, quantization_config=qconfig)
+
+    model = ORTModelForSeq2SeqLM.from_pretrained(INT8_DIR)
+    return pipeline("summarization", model=model,
+                    tokenizer=AutoTokenizer.from_pretrained(MODEL_ID),
+                    max_length=60, min_length=25)
+
+async def fetch_all(urls):
+    """
+    Download every article concurrently over one pooled HTTP/2 client.
+    Returns one entry per URL, None where the fetch failed — redirects are
+    followed (requests did this implicitly) and error pages are dropped so
+    the summariser never runs on a redirect stub or 404 body.
+    """
+    async with httpx.AsyncClient(http2=True, timeout=20, follow_redirects=True,
+                                 limits=httpx.Limits(max_connections=20)) as c:
+        responses = await asyncio.gather(*(c.get(u) for u in urls),
+                                         return_exceptions=True)
+    htmls = []
+    for url, r in zip(urls, responses):
+        if isinstance(r, Exception):
+            print(f"✗ {url}: {r}")
+            htmls.append(None)
+            continue
+        try:
+            r.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            print(f"✗ {url}: {e}")
+            htmls.append(None)
+            continue
+        htmls.append(r.text)
+    return htmls
 
 def scrape():
     with sync_playwright() as p:
@@ -24,35 +83,49 @@ def scrape():
         page = browser.new_page()
         page.goto(BASE_URL, wait_until="networkidle")
 
-        # Repeatedly click "Load More" until it disappears
+        # Repeatedly click "Load More" until it disappears or stops adding
+        # cards — wait on the card count instead of a fixed 800 ms sleep.
         while True:
+            n = page.locator(CARD_SEL).count()
             try:
                 page.get_by_role("button", name="Load More").click()
-                page.wait_for_timeout(800)          # ms – wait for cards
+                page.wait_for_function(
+                    f"document.querySelectorAll({CARD_SEL!r}).length > {n}",
+                    timeout=5000)
             except Exception:
-                break                               # no more button
+                break                               # no more button / no new cards
 
-        soup = BeautifulSoup(page.content(), "lxml")
+        # Pull href+text straight from the live DOM — skips serializing the
+        # rendered page and re-parsing it with BeautifulSoup.
+        cards = page.locator(CARD_SEL).evaluate_all(
+            "els => els.map(e => ({href: e.getAttribute('href'),"
+            "                      text: e.innerText}))")
         browser.close()
 
-    # Cards live inside <a> tags that wrap a <div role="article">
-    cards = soup.select("a[href^='/'][href*='press-'], \
-                          a[href^='/'][href*='blog-'], \
-                          a[href^='/'][href*='in-the-news-']")
+    titles = [" ".join(c["text"].split()).split(" Min Watch")[0] for c in cards]
+    links  = [urljoin(BASE_URL, c["href"]) for c in cards]
 
-    results = []
-    for a in cards:
-        title = a.get_text(" ", strip=True).split(" Min Watch")[0]
-        link  = urljoin(BASE_URL, a["href"])
-
-        # fetch the individual article (now a static page)
-        article_html = requests.get(link, timeout=20).text
+    # fetch the individual articles (now static pages) concurrently,
+    # dropping cards whose fetch failed so titles/links/bodies stay aligned
+    htmls  = asyncio.run(fetch_all(links))
+    titles = [t for t, h in zip(titles, htmls) if h is not None]
+    links  = [l for l, h in zip(links,  htmls) if h is not None]
+    bodies = []
+    for article_html in htmls:
+        if article_html is None:
+            continue
         art_soup = BeautifulSoup(article_html, "lxml")
-        body = " ".join(p.get_text(" ", strip=True)
-                        for p in art_soup.select("article p")[:12])  # first grafs
-        short = summarise(body)[0]["summary_text"]
+        bodies.append(" ".join(p.get_text(" ", strip=True)
+                      for p in SEL_GRAF.select(art_soup)[:12]))  # first grafs
 
-        results.append({"title": title, "summary": short, "url": link})
+    # one batched forward pass instead of a model call per card
+    shorts = (summarise_pipeline()(bodies, batch_size=8, truncation=True)
+              if bodies else [])
+
+    results = []
+    for title, link, short in zip(titles, links, shorts):
+        results.append({"title": title, "summary": short["summary_text"],
+                        "url": link})
         print(f"✓ {title}")
 
     OUTFILE.write_text("\n".join(json.dumps(r, ensure_ascii=False) for r in results))
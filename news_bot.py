@@ -6,14 +6,25 @@ new article, and posts one Slack message per article.
 Runs happily on the free GitHub Actions runner.
 """
 
-import json, re, time, hashlib, os, logging
+import re, time, os, logging, socket
+import queue, threading
+from functools import lru_cache
+import orjson
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import feedparser
 from urllib.parse import urljoin
 from playwright.sync_api import sync_playwright
 
+import soupsieve as sv
+import trafilatura
 from bs4 import BeautifulSoup
-from newspaper import Article, Config
+
+# selectors compiled once — soupsieve re-parses plain strings on every select()
+SEL_READ_MORE    = sv.compile('a:-soup-contains("Read more")')
+SEL_CAPELLA_CARD = sv.compile("a.resource-card[href]")
 
 
 # ---------- 1. SETTINGS you may touch ---------------------------------------
@@ -26,10 +37,11 @@ SOURCES = {
     "iceye":     "https://www.iceye.com/newsroom/press-releases",
     "rocketlab": "https://rocketlabcorp.com/updates/",
     "capella":   "https://www.capellaspace.com/media",
-    "spacewatch":"https://spacewatch.global/news/",
+    "spacewatch":"https://spacewatch.global/news/feed/",
 }
 
-CACHE_FILE = "sent_urls.json"      # remembers what we already posted
+CACHE_FILE = "sent_urls.jsonl"     # remembers what we already posted
+ETAG_FILE  = "etags.json"          # ETag/Last-Modified per index page
 SUMMARY_SENTENCES = 3              # ≈100 tokens
 # ---------------------------------------------------------------------------
 
@@ -44,126 +56,189 @@ logging.basicConfig(
 
 
 def load_cache():
-    if os.path.isfile(CACHE_FILE):
-        with open(CACHE_FILE) as f:
-            return set(json.load(f))
-    return set()
-
-def save_cache(cache):
-    with open(CACHE_FILE, "w") as f:
-        json.dump(sorted(cache), f)
-
-def hash_url(url: str) -> str:
-    return hashlib.sha1(url.encode()).hexdigest()
+    """Set of every URL ever posted — one JSON string per line, append-only."""
+    if not os.path.isfile(CACHE_FILE):
+        return set()
+    with open(CACHE_FILE, "rb") as f:
+        lines = [line for line in f if line.strip()]
+    cache = {orjson.loads(line) for line in lines}
+    if len(lines) > 2 * len(cache):        # appends have bloated the file
+        with open(CACHE_FILE, "wb") as f:
+            f.writelines(orjson.dumps(u, option=orjson.OPT_APPEND_NEWLINE)
+                         for u in sorted(cache))
+    return cache
+
+def append_cache(new_urls):
+    """Write only this run's additions — O(Δ) instead of a full rewrite."""
+    with open(CACHE_FILE, "ab") as f:
+        f.writelines(orjson.dumps(u, option=orjson.OPT_APPEND_NEWLINE)
+                     for u in sorted(new_urls))
+
+def load_etags():
+    if os.path.isfile(ETAG_FILE):
+        with open(ETAG_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    return {}
+
+def save_etags():
+    with open(ETAG_FILE, "wb") as f:
+        f.write(orjson.dumps(ETAGS))
+
+ETAGS = load_etags()
+
+def conditional_get(url, timeout=20):
+    """GET with If-None-Match/If-Modified-Since; None means 304 (unchanged)."""
+    cached = ETAGS.get(url, {})
+    hdrs = {}
+    if cached.get("etag"):
+        hdrs["If-None-Match"] = cached["etag"]
+    if cached.get("modified"):
+        hdrs["If-Modified-Since"] = cached["modified"]
+    r = SESSION.get(url, headers=hdrs, timeout=timeout)
+    if r.status_code == 304:
+        return None
+    etag, modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+    if etag or modified:
+        ETAGS[url] = {"etag": etag, "modified": modified}
+    return r
 
 # ---------- 2. SCRAPERS -----------------------------------------------------
 HEADERS = {"User-Agent": "space-news-bot (+https://github.com/yourrepo)"}
 
-# ---------- Playwright helper ------------------------------------------------
-def render_and_get_links(url, selector, max_links=30):
-    """
-    Open the page in headless Chromium, wait for JS to load, return the first
-    max_links hrefs that match CSS selector.
-    """
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
-        page.goto(url, wait_until="networkidle", timeout=30000)
-        links = page.locator(selector).evaluate_all("els => els.map(e => e.href)")
-        browser.close()
-        return links[:max_links]
-
-def click_then_get_links(url, click_text, card_selector, max_links=30):
-    """
-    • Open `url` in headless Chromium
-    • Click the button whose visible text is `click_text`
-    • After network is idle, collect hrefs that match `card_selector`
-    """
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
-        page.goto(url, wait_until="networkidle", timeout=30000)
-        page.click(f"text={click_text}", timeout=10000)
-        page.wait_for_load_state("networkidle", timeout=30000)
-        links = page.locator(card_selector).evaluate_all("els=>els.map(e=>e.href)")
-        browser.close()
-        return links[:max_links]
-
-# ------------------------------------------------------------------------------
+# CPython never caches getaddrinfo, so every connection that misses the pool
+# re-resolves DNS — wasteful when all ICEYE/Rocket Lab article URLs share a
+# host. Cache resolutions for the lifetime of the run (minutes at most).
+socket.getaddrinfo = lru_cache(maxsize=256)(socket.getaddrinfo)
+
+# One session for every HTTP call in the run: keeps TCP+TLS connections warm
+# across the scrapers, the article downloads and the Slack posts.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10, pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+))
+
+# Scrapers return None when the index 304'd (unchanged — nothing to do) and
+# a list otherwise, so an empty list still means "the selector found nothing".
 
 def get_iceye_urls():
-    soup = BeautifulSoup(requests.get(SOURCES["iceye"], headers=HEADERS,
-                                      timeout=20).text, "html.parser")
-    for a in soup.select("a"):
-        if a.text.strip().startswith("Read more"):
-            yield a["href"]
+    res = conditional_get(SOURCES["iceye"])
+    if res is None:                    # 304 — page unchanged since last run
+        return None
+    soup = BeautifulSoup(res.content, "lxml")
+    # filter in soupsieve/libxml2 instead of .text.strip() on every <a>
+    return [a["href"] for a in SEL_READ_MORE.select(soup)]
 
 def get_rocketlab_urls():
-    soup = BeautifulSoup(requests.get(SOURCES["rocketlab"], headers=HEADERS,
-                                      timeout=20).text, "html.parser")
-    for a in soup.select("a"):
-        if a.text.strip().endswith("Read more"):
-            yield urljoin(SOURCES["rocketlab"], a["href"])
-
-def get_capella_urls(max_cards: int = 30):
+    res = conditional_get(SOURCES["rocketlab"])
+    if res is None:
+        return None
+    soup = BeautifulSoup(res.content, "lxml")
+    return [urljoin(SOURCES["rocketlab"], a["href"])
+            for a in SEL_READ_MORE.select(soup)]
+
+def get_capella_urls(get_browser, max_cards: int = 30):
     base  = "https://www.capellaspace.com"
     start = f"{base}/media"
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page    = browser.new_page()
-        page.goto(start, wait_until="networkidle", timeout=30000)
+    # Try the static HTML first — rendering a full browser is orders of
+    # magnitude more expensive and only needed when the cards are JS-injected.
+    res = conditional_get(start)
+    if res is None:                    # unchanged — nothing new to render
+        return None
+    soup = BeautifulSoup(res.content, "lxml")
+    cards = SEL_CAPELLA_CARD.select(soup)
+    if cards:
+        return [urljoin(base, a["href"]) for a in cards[:max_cards]]
 
-        logging.info("🌐 Capella loaded /media, DOM length %s",
-                     len(page.content()))                       # ← 1
+    # Cards are JS-injected: the shell's validator says nothing about the
+    # rendered content, so drop it — a 304 here must never skip the render.
+    ETAGS.pop(start, None)
 
-        page.click("text=/press releases/i", timeout=10000)
+    logging.info("Capella cards not in static HTML; rendering with Playwright")
+    context = get_browser().new_context()
+    page    = context.new_page()
+    page.goto(start, wait_until="networkidle", timeout=30000)
 
-        # Wait up to 15 s for *any* injected card to appear
-        try:
-            page.wait_for_selector("a.resource-card[href]", timeout=15000)
-            logging.info("✔️  Cards injected; DOM length %s",
-                         len(page.content()))                   # ← 2
-        except:
-            logging.warning("❌ No cards appeared after click")  # ← 3
-            browser.close()
-            return []
+    # length only — avoids serializing the whole DOM to Python just to log it
+    logging.info("🌐 Capella loaded /media, DOM length %s",
+                 page.evaluate("document.documentElement.outerHTML.length"))
 
-        links = page.locator("a.resource-card[href]").evaluate_all(
-                     "els => els.map(e => e.href)")
-        browser.close()
+    page.click("text=/press releases/i", timeout=10000)
+
+    # Wait up to 15 s for *any* injected card to appear
+    try:
+        page.wait_for_selector("a.resource-card[href]", timeout=15000)
+        logging.info("✔️  Cards injected; DOM length %s",
+                     page.evaluate("document.documentElement.outerHTML.length"))
+    except:
+        logging.warning("❌ No cards appeared after click")  # ← 3
+        context.close()
+        return []
+
+    links = page.locator("a.resource-card[href]").evaluate_all(
+                 "els => els.map(e => e.href)")
+    context.close()
     return links[:max_cards]
 
 
 
 def get_spacewatch_urls():
-    # render /news front page; pick headline links
-    url = "https://spacewatch.global/news/"
-    return render_and_get_links(url, "h3.entry-title a")
+    # the WordPress RSS feed is static — no need to render the front page
+    url    = SOURCES["spacewatch"]
+    cached = ETAGS.get(url, {})
+    feed   = feedparser.parse(url, etag=cached.get("etag"),
+                              modified=cached.get("modified"))
+    if getattr(feed, "status", None) == 304:
+        return None
+    etag, modified = getattr(feed, "etag", None), getattr(feed, "modified", None)
+    if etag or modified:
+        ETAGS[url] = {"etag": etag, "modified": modified}
+    return feed.entries
 
 
 
 
 
-SCRAPER_FUNCS = [
-    get_iceye_urls,
-    get_rocketlab_urls,
-    get_capella_urls,
-    get_spacewatch_urls,
+SCRAPER_FUNCS = [       # (scraper, needs_js → may render, index URL in ETAGS)
+    (get_iceye_urls,      False, SOURCES["iceye"]),
+    (get_rocketlab_urls,  False, SOURCES["rocketlab"]),
+    (get_capella_urls,    True,  SOURCES["capella"]),
+    (get_spacewatch_urls, False, SOURCES["spacewatch"]),
 ]
 
 # ---------- 3. SUMMARY ------------------------------------------------------
+MAX_HTML_BYTES = 512 * 1024        # plenty for a title + the first 100 words
+
+def fetch_html(url: str) -> str:
+    """
+    Stream at most MAX_HTML_BYTES of the page. Some article pages run to
+    several MB (inlined data-URI images, JSON-LD) and we only preview the
+    first 100 words — capping the read bounds memory and bandwidth.
+    """
+    with SESSION.get(url, stream=True, timeout=20) as r:
+        r.raise_for_status()       # error pages go to the feed-text fallback
+        buf = bytearray()
+        for chunk in r.iter_content(8192):
+            buf.extend(chunk)
+            if len(buf) >= MAX_HTML_BYTES:
+                break
+        return buf.decode(r.encoding or "utf-8", "ignore")
+
 def summarise(url: str, fallback_text: str = "") -> tuple[str, str]:
     """
     Try to download the full article; if that fails, use the fallback_text
     provided by the RSS/JSON feed.  Always return (title, ≤100-token preview).
     """
-    cfg = Config(); cfg.request_headers = HEADERS
-    art = Article(url, language="en", config=cfg)
     try:
-        art.download(); art.parse()
-        title = art.title or "Untitled"
-        words = art.text.replace("\n", " ").split()
+        downloaded = fetch_html(url)
+        extracted  = trafilatura.extract(downloaded, include_comments=False,
+                                         include_tables=False,
+                                         favor_precision=True) or ""
+        meta  = trafilatura.extract_metadata(downloaded)
+        title = (meta.title if meta and meta.title else None) or "Untitled"
+        words = extracted.replace("\n", " ").split()
         preview = " ".join(words[:100]) or "(no preview)"
     except Exception as e:
         logging.warning("Fallback to feed text for %s  (%s)", url, e)
@@ -176,44 +251,131 @@ def summarise(url: str, fallback_text: str = "") -> tuple[str, str]:
 
 
 # ---------- 4. SLACK --------------------------------------------------------
-def send_slack(title: str, summary: str, url: str):
-    payload = {
-        "text": f"*{title}*\n{summary}\n<{url}|Read the full article>",
-    }
-    r = requests.post(WEBHOOK_URL, json=payload, timeout=10)
-    r.raise_for_status()          # stop if webhook URL is wrong
-    time.sleep(1.1)               # ≤1 message/sec (Slack limit)
+MAX_BLOCKS = 50                   # Slack's per-message block limit
 
-# ---------- 5. MAIN ---------------------------------------------------------
-def main():
-    seen = load_cache()
-    new_seen = set()
-
-    for fn in SCRAPER_FUNCS:
-        logging.info("Running scraper: %s", fn.__name__)   # inside the loop
-        found = False                                      # inside the loop
+def send_slack(batch):
+    """
+    Post a whole scraper's articles as one blocks message (chunked to
+    Slack's 50-block cap) — one round-trip and one rate-limit sleep per
+    batch instead of per article.  Returns the tuples actually delivered,
+    stopping at the first failed chunk, so the caller never re-posts a
+    chunk that already reached Slack.
+    """
+    posted = []
+    for i in range(0, len(batch), MAX_BLOCKS):
+        chunk = batch[i:i + MAX_BLOCKS]
+        payload = {"blocks": [
+            {"type": "section",
+             "text": {"type": "mrkdwn",
+                      "text": f"*{title}*\n{summary}\n<{url}|Read the full article>"}}
+            for title, summary, url in chunk]}
+        try:
+            r = SESSION.post(WEBHOOK_URL, data=orjson.dumps(payload),
+                             headers={"Content-Type": "application/json"},
+                             timeout=10)
+            r.raise_for_status()  # stop if webhook URL is wrong
+        except Exception as e:
+            logging.error("Slack post failed after %d/%d articles : %s",
+                          len(posted), len(batch), e)
+            break
+        posted += chunk
+        time.sleep(1.1)           # ≤1 message/sec (Slack limit)
+    return posted
 
-        for entry in fn():                                 # still indented
-            found = True
-            url   = entry.link if hasattr(entry, "link") else entry
-            descr = getattr(entry, "summary", "") if hasattr(entry, "summary") else ""
-            key   = hash_url(url)
+# ---------- 5. MAIN ---------------------------------------------------------
+MAX_WORKERS = 8        # parallel article downloads (SESSION is thread-safe)
 
-            if key in seen or key in new_seen:
+def main():
+    seen     = load_cache()
+    new_seen = set()               # URLs actually posted this run
+    queued   = set()               # URLs submitted this run
+
+    # One dedicated poster thread drains the queue, so Slack still sees
+    # ≤1 message/sec no matter how many download workers run in parallel.
+    posts = queue.Queue()
+
+    def slack_worker():
+        while True:
+            item = posts.get()
+            if item is None:
+                break
+            batch, etag_key = item
+            posted = send_slack(batch)
+            new_seen.update(url for _, _, url in posted)
+            if len(posted) < len(batch):
+                # drop the index validator: a 304 next run would skip the
+                # unposted remainder until the page itself changed
+                ETAGS.pop(etag_key, None)
+            else:
+                logging.info("Posted %d articles", len(posted))
+
+    poster = threading.Thread(target=slack_worker)
+    poster.start()
+
+    # A scraper blowing up (goto timeout, connection error after retries)
+    # must still deliver the sentinel and flush completed work, or the
+    # poster thread keeps the process alive forever on posts.get().
+    try:
+        run_scrapers(seen, queued, posts)
+    finally:
+        posts.put(None)      # sentinel: all scrapers done
+        poster.join()
+        append_cache(new_seen)
+        save_etags()
+        SESSION.close()
+
+def run_scrapers(seen, queued, posts):
+    with sync_playwright() as p, \
+         ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        browser = None
+
+        def get_browser():             # launch Chromium only if JS is needed
+            nonlocal browser
+            if browser is None:
+                browser = p.chromium.launch()
+            return browser
+
+        for fn, needs_js, etag_key in SCRAPER_FUNCS:
+            logging.info("Running scraper: %s", fn.__name__)
+
+            entries = fn(get_browser) if needs_js else fn()
+            if entries is None:            # 304 — the common, healthy case
+                logging.info("Scraper %s: index unchanged (304)", fn.__name__)
                 continue
-            try:
-                title, summary = summarise(url, descr)     # pass feed summary
-                send_slack(title, summary, url)
-                logging.info("Posted %s", title)
-                new_seen.add(key)
-            except Exception as e:
-                logging.error("Failed on %s : %s", url, e)
-
-        if not found:                                      # still inside outer loop
-            logging.warning("Scraper %s returned ZERO URLs", fn.__name__)
-
-    # after the outer loop finishes
-    save_cache(seen.union(new_seen))
+
+            # drop already-posted URLs up front, before any download work
+            fresh = []
+            for entry in entries:
+                url   = entry.link if hasattr(entry, "link") else entry
+                descr = getattr(entry, "summary", "") if hasattr(entry, "summary") else ""
+                if url in seen or url in queued:
+                    continue
+                queued.add(url)
+                fresh.append((url, descr))
+
+            if not entries:
+                logging.warning("Scraper %s returned ZERO URLs", fn.__name__)
+            elif not fresh:
+                logging.info("Scraper %s: all %d URLs already posted",
+                             fn.__name__, len(entries))
+
+            futures = {pool.submit(summarise, url, descr): url
+                       for url, descr in fresh}            # future -> url
+
+            batch = []
+            for fut in as_completed(futures):
+                url = futures[fut]
+                try:
+                    title, summary = fut.result()
+                    batch.append((title, summary, url))
+                except Exception as e:
+                    logging.error("Failed on %s : %s", url, e)
+                    ETAGS.pop(etag_key, None)  # re-read the index next run
+            if batch:
+                posts.put((batch, etag_key))   # one Slack message per scraper
+
+        if browser is not None:
+            browser.close()
 
 # ---------- 6. ENTRY POINT --------------------------------------------------
 if __name__ == "__main__":